@@ -4,6 +4,7 @@ from collections import namedtuple
 from .subblocks import (
     parse_run_header,
     parse_event_header,
+    make_event_header_parser,
     parse_event_end,
     parse_cherenkov_photons,
     parse_particle_data,
@@ -13,7 +14,7 @@ from .subblocks import (
 )
 from .subblocks.longitudinal import longitudinal_header_dtype
 from .subblocks.data import mmcs_cherenkov_photons_dtype
-from .io import iter_blocks, read_buffer_size, open_compressed
+from .io import iter_blocks, probe, open_compressed
 
 from .constants import BLOCK_SIZE_BYTES, EVTH_VERSION_POSITION
 
@@ -37,15 +38,17 @@ class CorsikaFile:
         self.EventClass = Event
 
         self.parse_blocks = parse_blocks
-        self._buffer_size = read_buffer_size(path)
-        self._f = open_compressed(path)
+        compression, self._buffer_size = probe(path)
+        self._f = open_compressed(path, compression=compression)
         self._block_iter = iter_blocks(self._f)
 
         runh_bytes = next(self._block_iter)
         if not runh_bytes[:4] == b'RUNH':
             raise ValueError('File does not start with b"RUNH"')
 
-        self.run_header = parse_run_header(runh_bytes)[0]
+        # blocks are views of their whole record, copy the ones that are kept
+        # so they do not keep the record in memory
+        self.run_header = parse_run_header(bytes(runh_bytes))[0]
         self.version = round(float(self.run_header['version']), 4)
         self._run_end = None
 
@@ -77,16 +80,16 @@ class CorsikaFile:
             raise IOError("File seems to be truncated")
 
         if block[:4] == b'RUNE':
-            self._run_end = parse_run_end(block)
+            self._run_end = parse_run_end(bytes(block))
             raise StopIteration()
 
         if block[:4] != b'EVTH':
-            raise IOError('EVTH block expected but found {}'.format(block[:4]))
+            raise IOError('EVTH block expected but found {}'.format(bytes(block[:4])))
 
         if self.parse_blocks:
-            event_header = parse_event_header(block)[0]
+            event_header = parse_event_header(bytes(block))[0]
         else:
-            event_header = _to_floatarray(block)
+            event_header = _to_floatarray(bytes(block))
 
         data_bytes = bytearray()
         long_bytes = bytearray()
@@ -109,11 +112,11 @@ class CorsikaFile:
                 raise IOError("File seems to be truncated")
 
         if self.parse_blocks:
-            event_end = parse_event_end(block)[0]
+            event_end = parse_event_end(bytes(block))[0]
             data = self.parse_data_blocks(data_bytes)
             longitudinal = parse_longitudinal(long_bytes)
         else:
-            event_end = _to_floatarray(block)
+            event_end = _to_floatarray(bytes(block))
             data = _to_floatarray(data_bytes).reshape(-1, 7)
             longitudinal = _to_floatarray(long_bytes)
 
@@ -138,7 +141,7 @@ class CorsikaFile:
 
         while block:
             if block[:4] == b'RUNE':
-                self._run_end = parse_run_end(block)[0]
+                self._run_end = parse_run_end(bytes(block))[0]
                 break
 
             if (
@@ -158,7 +161,8 @@ class CorsikaFile:
 
         self._f.seek(pos)
 
-        event_headers = parse_event_header(event_header_data)
+        # only headers matching the version of the run header were collected
+        event_headers = make_event_header_parser(self.version)(event_header_data)
 
         return self.run_header, event_headers, self._run_end
 
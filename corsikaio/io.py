@@ -1,5 +1,12 @@
 import gzip
+import io
+import mmap
+import os
 import struct
+import threading
+import weakref
+
+import numpy as np
 
 from .constants import BLOCK_SIZE_BYTES
 
@@ -8,6 +15,31 @@ from .constants import BLOCK_SIZE_BYTES
 DEFAULT_BUFFER_SIZE = BLOCK_SIZE_BYTES * 100
 #: struct definition of the fortran record marker
 RECORD_MARKER = struct.Struct('i')
+#: magic bytes at the start of gzip compressed files
+GZIP_MAGIC = b'\x1f\x8b'
+#: magic bytes at the start of zstd compressed files
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+#: zstd compressed files smaller than this are decompressed into memory at once
+ZSTD_IN_MEMORY_THRESHOLD = 128 * 1024**2
+#: chunk size for the parallel gzip decompression using rapidgzip
+RAPIDGZIP_CHUNK_SIZE = 4 * 1024**2
+
+
+# decompressors are not thread safe, so one is kept per thread
+_zstd_decompressors = threading.local()
+
+
+def _get_zstd_decompressor():
+    '''
+    Get the ZstdDecompressor of the current thread, reusing its
+    decompression context across calls of open_compressed.
+    '''
+    decompressor = getattr(_zstd_decompressors, 'decompressor', None)
+    if decompressor is None:
+        from zstandard import ZstdDecompressor
+        decompressor = ZstdDecompressor()
+        _zstd_decompressors.decompressor = decompressor
+    return decompressor
 
 
 def is_gzip(path):
@@ -15,27 +47,118 @@ def is_gzip(path):
     to the gzip marker bytes.
     '''
     with open(path, 'rb') as f:
-        marker_bytes = f.read(2)
-
-    return marker_bytes[0] == 0x1f and marker_bytes[1] == 0x8b
+        return f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
 
 
 def is_zstd(path):
     '''Test if a file is compressed using zstd using its magic marker bytes
     '''
     with open(path, 'rb') as f:
-        marker_bytes = f.read(4)
+        return f.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC
+
+
+def _compression_from_marker(marker_bytes):
+    '''Determine the compression from the first four bytes of a file'''
+    if marker_bytes.startswith(GZIP_MAGIC):
+        return 'gzip'
 
-    return marker_bytes == b'\x28\xb5\x2f\xfd'
+    if marker_bytes.startswith(ZSTD_MAGIC):
+        return 'zstd'
 
+    return None
 
-def open_compressed(path):
-    if is_gzip(path):
-        return gzip.open(path)
 
-    if is_zstd(path):
+def _buffer_size_from_marker(marker_bytes):
+    '''Determine the buffer size from the first four (uncompressed) bytes of a file'''
+    if marker_bytes == b'RUNH':
+        return None
+
+    buffer_size, = RECORD_MARKER.unpack(marker_bytes)
+    return buffer_size
+
+
+def probe(path):
+    '''
+    Determine compression and CORSIKA buffer size of a file,
+    opening it only once.
+
+    Returns
+    -------
+    compression: str or None
+        'gzip', 'zstd' or None for uncompressed files
+    buffer_size: int or None
+        the buffer size as returned by `read_buffer_size`
+    '''
+    with open(path, 'rb') as f:
+        marker_bytes = f.read(RECORD_MARKER.size)
+        compression = _compression_from_marker(marker_bytes)
+
+        # the buffer size is stored in the uncompressed data
+        if compression == 'gzip':
+            f.seek(0)
+            marker_bytes = gzip.GzipFile(fileobj=f).read(RECORD_MARKER.size)
+        elif compression == 'zstd':
+            f.seek(0)
+            reader = _get_zstd_decompressor().stream_reader(f, closefd=False)
+            marker_bytes = reader.read(RECORD_MARKER.size)
+
+    return compression, _buffer_size_from_marker(marker_bytes)
+
+
+def open_compressed(
+    path,
+    size_threshold=ZSTD_IN_MEMORY_THRESHOLD,
+    zstd_buffer_size=DEFAULT_BUFFER_SIZE,
+    compression='infer',
+):
+    '''
+    Open a possibly compressed file for reading.
+
+    gzip compressed files are decompressed in parallel if
+    rapidgzip is installed, otherwise using the gzip module.
+    zstd compressed files smaller than ``size_threshold`` bytes
+    are decompressed in a single call and returned as in-memory file,
+    larger files are decompressed while reading through a buffer
+    of ``zstd_buffer_size`` bytes.
+
+    If the compression is already known, e.g. from `probe`, it
+    can be passed as ``compression`` to avoid detecting it again.
+    '''
+    if compression == 'infer':
+        with open(path, 'rb') as f:
+            compression = _compression_from_marker(f.read(RECORD_MARKER.size))
+
+    if compression == 'gzip':
+        try:
+            import rapidgzip
+        except ImportError:
+            return gzip.open(path)
+
+        reader = rapidgzip.RapidgzipFile(
+            path,
+            parallelization=os.cpu_count(),
+            chunk_size=RAPIDGZIP_CHUNK_SIZE,
+        )
+        f = io.BufferedReader(reader)
+        # rapidgzip aborts the interpreter at shutdown if a file is still open
+        weakref.finalize(f, reader.close)
+        return f
+
+    if compression == 'zstd':
+        if os.path.getsize(path) < size_threshold:
+            decompressor = _get_zstd_decompressor()
+            with open(path, 'rb') as f:
+                reader = decompressor.stream_reader(f, read_across_frames=True)
+                return io.BytesIO(reader.readall())
+
+        # streaming readers stay in use after returning,
+        # so they cannot share the decompressor of the thread
         from zstandard import ZstdDecompressor
-        return ZstdDecompressor().stream_reader(open(path, 'rb'))
+
+        # the buffer serves the many small reads of record markers
+        # without going through the decompressor each time
+        reader = ZstdDecompressor().stream_reader(open(path, 'rb'))
+        return io.BufferedReader(reader, buffer_size=zstd_buffer_size)
 
     return open(path, 'rb')
 
@@ -47,45 +170,51 @@ def read_buffer_size(path):
     if not interpret it as unsigned integer, the
     size of the CORSIKA buffer in bytes
     '''
-    with open_compressed(path) as f:
-        data = f.read(RECORD_MARKER.size)
-
-        if data == b'RUNH':
-            return None
-
-        buffer_size, = RECORD_MARKER.unpack(data)
-
+    _, buffer_size = probe(path)
     return buffer_size
 
 
-def iter_blocks(f):
-    is_fortran_file = True
+def _iter_record_data(f):
+    '''
+    Iterate over the records of a CORSIKA file, yielding the
+    payload of each record and the number of blocks it contains.
+
+    For fortran sequential files, a record is the data between two
+    record markers, otherwise chunks of DEFAULT_BUFFER_SIZE are read.
+    '''
     buffer_size = DEFAULT_BUFFER_SIZE
 
+    # leading record markers are read into this buffer to avoid
+    # allocating new bytes objects for each of them
+    marker = bytearray(RECORD_MARKER.size)
 
-    data = f.read(4)
-    f.seek(0)
-    if data == b'RUNH':
-        is_fortran_file = False
+    # no seeking back after determining the file type, so that
+    # also non-seekable streams can be read
+    n_read = f.readinto(marker)
+    is_fortran_file = marker != b'RUNH'
+    head = b'' if is_fortran_file else bytes(marker)
 
     while True:
         # for the fortran-chunked output, we need to read the record size
         if is_fortran_file:
-            data = f.read(RECORD_MARKER.size)
-            if len(data) == 0:
+            if n_read == 0:
                 return
 
-            if len(data) < RECORD_MARKER.size:
+            if n_read < RECORD_MARKER.size:
                 raise IOError("Read less bytes than expected, file seems to be truncated")
 
-            buffer_size, = RECORD_MARKER.unpack(data)
+            buffer_size, = RECORD_MARKER.unpack_from(marker)
 
-        data = f.read(buffer_size)
-        if is_fortran_file:
+            # read the payload together with the trailing record marker
+            data = f.read(buffer_size + RECORD_MARKER.size)
             if len(data) < buffer_size:
                 raise IOError("Read less bytes than expected, file seems to be truncated")
 
+            data = memoryview(data)[:buffer_size]
+
         else:
+            data = head + f.read(buffer_size - len(head))
+            head = b''
             if len(data) == 0:
                 return
 
@@ -93,15 +222,58 @@ def iter_blocks(f):
         if rest != 0:
             raise IOError("Read less bytes than expected, file seems to be truncated")
 
-        for block in range(n_blocks):
-            start = block * BLOCK_SIZE_BYTES
-            stop = start + BLOCK_SIZE_BYTES
-            block = data[start:stop]
-            yield block
+        yield data, n_blocks
 
-        # read trailing record marker
         if is_fortran_file:
-            f.read(RECORD_MARKER.size)
+            n_read = f.readinto(marker)
+
+
+def iter_blocks(f):
+    '''
+    Iterate over the blocks of a CORSIKA file, e.g. 273 4-byte floats.
+    '''
+    for data, n_blocks in _iter_record_data(f):
+        # slicing a memoryview is the cheapest zero-copy way to split
+        # the record, faster than iterating the rows of a numpy view
+        view = memoryview(data)
+        for start in range(0, n_blocks * BLOCK_SIZE_BYTES, BLOCK_SIZE_BYTES):
+            yield view[start:start + BLOCK_SIZE_BYTES]
+
+
+def iter_records(f, block_dtype):
+    '''
+    Iterate over the records of a CORSIKA file, parsing all blocks
+    of a record at once into an array of ``block_dtype``.
+
+    The itemsize of ``block_dtype`` has to divide BLOCK_SIZE_BYTES,
+    e.g. one of the header dtypes or a dtype for the data sub blocks.
+    '''
+    for data, _ in _iter_record_data(f):
+        yield np.frombuffer(data, dtype=block_dtype)
+
+
+def read_all_blocks(path):
+    '''
+    Read all blocks of an uncompressed file that is not written as fortran
+    sequential file as array of shape (n_blocks, BLOCK_SIZE_BYTES).
+
+    The file is memory mapped, so the returned array is a read-only,
+    zero-copy view of the file contents.
+    '''
+    compression, buffer_size = probe(path)
+    if compression is not None or buffer_size is not None:
+        raise ValueError(
+            "read_all_blocks only supports uncompressed files without record markers"
+        )
+
+    with open(path, 'rb') as f:
+        # the mapping stays valid after closing the file
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mm) % BLOCK_SIZE_BYTES != 0:
+        raise IOError("Read less bytes than expected, file seems to be truncated")
+
+    return np.frombuffer(mm, dtype=np.uint8).reshape(-1, BLOCK_SIZE_BYTES)
 
 
 def read_block(f, buffer_size=None):
@@ -1,10 +1,12 @@
+from functools import lru_cache
 import numpy as np
 import struct
+import warnings
 
 from .run_header import run_header_types
 from .run_end import run_end_dtype
 
-from .event_header import event_header_types
+from .event_header import event_header_types, event_header_dtype_77xxx
 from .event_end import event_end_dtype
 
 from .data import cherenkov_photons_dtype, particle_data_dtype
@@ -14,6 +16,7 @@ from ..constants import RUNH_VERSION_POSITION, EVTH_VERSION_POSITION
 
 __all__ = [
     "parse_event_header",
+    "make_event_header_parser",
     "parse_run_header",
     "parse_cherenkov_photons",
     "parse_particle_data",
@@ -32,10 +35,48 @@ def parse_run_end(run_end_bytes):
     return np.frombuffer(run_end_bytes, dtype=run_end_dtype)
 
 
+def get_event_header_dtype(version):
+    dtype = event_header_types.get(get_version_key(version))
+    if dtype is None:
+        warnings.warn("Version unknown, using event header dtype definition of version 7.7XXX")
+        dtype = event_header_dtype_77xxx
+    return dtype
+
+
 def parse_event_header(event_header_bytes):
     version = get_version(event_header_bytes, EVTH_VERSION_POSITION)
-    version = float(str(version)[:3])
-    return np.frombuffer(event_header_bytes, dtype=event_header_types[version])
+    return np.frombuffer(event_header_bytes, dtype=get_event_header_dtype(version))
+
+
+@lru_cache()
+def make_event_header_parser(version, fields=None):
+    """Create a parser for event headers of a fixed CORSIKA version.
+
+    The dtype is looked up and reduced to the requested fields once,
+    parsers are cached per version and fields.
+
+    Parameters
+    ----------
+    version: float
+        CORSIKA version of the event headers, e.g. ``CorsikaFile.version``
+    fields: tuple(str) or None
+        Names of the fields to parse, all fields if None.
+
+    Return
+    ------
+    parse: callable
+        Function parsing the bytes of one or more event headers
+        into a structured array.
+    """
+    dtype = get_event_header_dtype(version)
+    if fields is not None:
+        # selecting fields keeps their offsets and the itemsize
+        dtype = dtype[list(fields)]
+
+    def parse(event_header_bytes):
+        return np.frombuffer(event_header_bytes, dtype=dtype)
+
+    return parse
 
 
 def parse_event_end(event_end_bytes):
@@ -47,6 +88,13 @@ def get_version(header_bytes, version_pos):
     return round(struct.unpack("f", header_bytes[sl])[0], 4)
 
 
+def get_version_key(version):
+    """Get the (major, minor) version tuple, e.g. (7, 5) for version 7.57"""
+    # versions have at most four decimals, rounding removes floating point
+    # errors before truncating to the minor version
+    return divmod(int(round(float(version) * 10, 3)), 10)
+
+
 def parse_data_block(data_block_bytes, dtype):
     data = np.frombuffer(data_block_bytes, dtype=dtype)
     empty = data == np.zeros(1, dtype=dtype)
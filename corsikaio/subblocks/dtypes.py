@@ -1,4 +1,4 @@
-from collections import namedtuple, defaultdict
+from collections import namedtuple
 import numpy as np
 
 
@@ -9,17 +9,18 @@ Field.__new__.__defaults__ = (None, 1, "f4")
 
 
 def build_dtype(fields, itemsize=4 * 273):
-    dt = defaultdict(list)
+    # transpose the fields into one sequence per attribute
+    positions, names, _, shapes, dtypes = zip(*fields)
+
+    dt = {
+        "names": list(names),
+        "offsets": ((np.array(positions) - 1) * 4).tolist(),
+        "formats": [
+            dtype if shape == 1 else (dtype, shape)
+            for shape, dtype in zip(shapes, dtypes)
+        ],
+    }
     if itemsize is not None:
         dt["itemsize"] = itemsize
 
-    for field in fields:
-        dt["names"].append(field.name)
-        dt["offsets"].append((field.position - 1) * 4)
-        if field.shape != 1:
-            dt["formats"].append((field.dtype, field.shape))
-        else:
-            dt["formats"].append(field.dtype)
-
-    return np.dtype(dict(**dt))
-
+    return np.dtype(dt)
@@ -107,7 +107,7 @@ event_header_fields_73 = event_header_fields_65 + [
     Field(173, "conex_weight_limit_sampling_em"),
 ]
 
-event_header_fields_74 = event_header_fields_73.copy()
+event_header_fields_74 = event_header_fields_73
 
 event_header_fields_75 = event_header_fields_74 + [
     Field(174, "augerhit_stripes_half_width", unit="cm"),
@@ -123,21 +123,18 @@ event_header_fields_75 = event_header_fields_74 + [
     Field(221, "icecube_gzip_flag"),
     Field(222, "icecube_pipe_flag"),
 ]
-event_header_fields_76 = event_header_fields_75.copy()
-event_header_fields_77 = event_header_fields_76.copy()
+event_header_fields_76 = event_header_fields_75
+event_header_fields_77 = event_header_fields_75
 
 event_header_dtype_65xxx = build_dtype(event_header_fields_65)
 event_header_dtype_73xxx = build_dtype(event_header_fields_73)
-event_header_dtype_74xxx = build_dtype(event_header_fields_74)
+# versions with identical layout share the same dtype object
+event_header_dtype_74xxx = event_header_dtype_73xxx
 event_header_dtype_75xxx = build_dtype(event_header_fields_75)
-event_header_dtype_76xxx = build_dtype(event_header_fields_76)
-event_header_dtype_77xxx = build_dtype(event_header_fields_77)
+event_header_dtype_76xxx = event_header_dtype_75xxx
+event_header_dtype_77xxx = event_header_dtype_75xxx
 
 
-def warn_dtype():
-    warnings.warn("Version unknown, using event header dtype definition of version 7.7XXX")
-    return event_header_dtype_77xxx
-
 def warn_fields():
     warnings.warn("Version unknown, using event header fields definition of version 7.7XXX")
     return event_header_fields_77
@@ -150,10 +147,12 @@ event_header_fields[7.5] = event_header_fields_75
 event_header_fields[7.6] = event_header_fields_76
 event_header_fields[7.7] = event_header_fields_77
 
-event_header_types = defaultdict(warn_dtype)
-event_header_types[6.5] = event_header_dtype_65xxx
-event_header_types[7.3] = event_header_dtype_73xxx
-event_header_types[7.4] = event_header_dtype_74xxx
-event_header_types[7.5] = event_header_dtype_75xxx
-event_header_types[7.6] = event_header_dtype_76xxx
-event_header_types[7.7] = event_header_dtype_76xxx
+# keyed by (major, minor) version, see `corsikaio.subblocks.get_version_key`
+event_header_types = {
+    (6, 5): event_header_dtype_65xxx,
+    (7, 3): event_header_dtype_73xxx,
+    (7, 4): event_header_dtype_74xxx,
+    (7, 5): event_header_dtype_75xxx,
+    (7, 6): event_header_dtype_76xxx,
+    (7, 7): event_header_dtype_77xxx,
+}
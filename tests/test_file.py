@@ -118,3 +118,25 @@ def test_truncated(tmp_path, size):
         with CorsikaParticleFile(path) as f:
             for _ in f:
                 pass
+
+
+def _owner(array):
+    '''Get the object owning the memory of an array'''
+    base = array.base
+    while isinstance(base, np.ndarray):
+        base = base.base
+    if isinstance(base, memoryview):
+        base = base.obj
+    return base
+
+
+@pytest.mark.parametrize("parse_blocks", (True, False))
+def test_kept_blocks_do_not_pin_records(parse_blocks):
+    from corsikaio import CorsikaFile
+
+    with CorsikaFile('tests/resources/corsika75700', parse_blocks=parse_blocks) as f:
+        assert len(_owner(f.run_header)) == BLOCK_SIZE_BYTES
+
+        for event in f:
+            assert len(_owner(event.header)) == BLOCK_SIZE_BYTES
+            assert len(_owner(event.end)) == BLOCK_SIZE_BYTES
@@ -11,6 +11,14 @@ def test_is_not_gzip(tmp_path):
 
     assert not is_gzip(path)
 
+def test_is_gzip_empty_file(tmp_path):
+    from corsikaio.io import is_gzip
+
+    path = tmp_path / "empty_file"
+    path.touch()
+
+    assert not is_gzip(path)
+
 def test_is_gzip(tmp_path):
     from corsikaio.io import is_gzip
 
@@ -20,3 +28,11 @@ def test_is_gzip(tmp_path):
         f.write(b'Hello World')
 
     assert is_gzip(path)
+
+
+def test_open_compressed_gzip():
+    from corsikaio.io import open_compressed
+
+    path = 'tests/resources/accidental_evth.gz'
+    with open_compressed(path) as f, gzip.open(path) as expected:
+        assert f.read() == expected.read()
@@ -3,6 +3,7 @@ import numpy as np
 from scipy.io import FortranFile
 
 from corsikaio.io import iter_blocks
+from corsikaio.constants import BLOCK_SIZE_BYTES
 
 
 test_files = (
@@ -18,6 +19,17 @@ def test_fortran_raw():
     assert read_buffer_size('tests/resources/corsika74100') == 22932  # standard CORSIKA buffer size
 
 
+@pytest.mark.parametrize("path,expected", [
+    ('tests/resources/mmcs65', (None, None)),
+    ('tests/resources/corsika74100', (None, 22932)),
+    ('tests/resources/accidental_evth.gz', ('gzip', None)),
+])
+def test_probe(path, expected):
+    from corsikaio.io import probe
+
+    assert probe(path) == expected
+
+
 def test_fortran_raw_file():
     from corsikaio import CorsikaFile
 
@@ -168,3 +180,61 @@ def test_iter_blocks_truncated(size, tmp_path, dummy_file):
         with path.open("rb") as f:
             for _ in iter_blocks(f):
                 pass
+
+
+def test_iter_records(dummy_file):
+    from corsikaio.io import iter_records
+    from corsikaio.subblocks.dtypes import Field, build_dtype
+
+    dtype = build_dtype([Field(1, "marker", dtype="S4"), Field(2, "values", shape=272)])
+    data = np.arange(273).astype(np.float32)
+
+    with dummy_file.open('rb') as f:
+        blocks = np.concatenate(list(iter_records(f, dtype)))
+
+    assert len(blocks) == 27
+    assert blocks[0]['marker'] == b'RUNH'
+    assert blocks[-1]['marker'] == b'RUNE'
+    assert np.all(blocks['marker'][1:-1:5] == b'EVTH')
+    assert np.all(blocks['marker'][5:-1:5] == b'EVTE')
+    assert (blocks['values'] == data[1:]).all()
+
+
+def test_read_all_blocks(simple_dummy_file):
+    from corsikaio.io import read_all_blocks
+
+    blocks = read_all_blocks(simple_dummy_file)
+
+    with simple_dummy_file.open('rb') as f:
+        expected = [bytes(block) for block in iter_blocks(f)]
+
+    assert blocks.shape == (27, BLOCK_SIZE_BYTES)
+    assert [block.tobytes() for block in blocks] == expected
+
+
+def test_read_all_blocks_fortran(fortran_raw_dummy_file):
+    from corsikaio.io import read_all_blocks
+
+    with pytest.raises(ValueError, match="without record markers"):
+        read_all_blocks(fortran_raw_dummy_file)
+
+
+def test_read_all_blocks_truncated(tmp_path, simple_dummy_file):
+    from corsikaio.io import read_all_blocks
+
+    path = tmp_path / "truncated.dat"
+    path.write_bytes(simple_dummy_file.read_bytes()[:5000])
+
+    with pytest.raises(IOError, match="file seems to be truncated"):
+        read_all_blocks(path)
+
+
+def test_iter_blocks_keep_references(dummy_file):
+    """Blocks still referenced must not be overwritten by reading further records"""
+    with dummy_file.open('rb') as f:
+        blocks = list(iter_blocks(f))
+
+    with dummy_file.open('rb') as f:
+        expected = [bytes(block) for block in iter_blocks(f)]
+
+    assert [bytes(block) for block in blocks] == expected
@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+
+
+def test_get_version_key():
+    from corsikaio.subblocks import get_version_key
+
+    assert get_version_key(6.5) == (6, 5)
+    assert get_version_key(7.41) == (7, 4)
+    assert get_version_key(7.57) == (7, 5)
+    assert get_version_key(7.7) == (7, 7)
+    assert get_version_key(np.float32(7.6)) == (7, 6)
+
+
+def test_parse_event_header_unknown_version():
+    from corsikaio.subblocks import parse_event_header
+    from corsikaio.subblocks.event_header import event_header_dtype_77xxx
+    from corsikaio.constants import BLOCK_SIZE_FLOATS, EVTH_VERSION_POSITION
+
+    data = np.zeros(BLOCK_SIZE_FLOATS, dtype=np.float32)
+    data[0] = np.frombuffer(b'EVTH', dtype=np.float32)[0]
+    data[EVTH_VERSION_POSITION - 1] = 9.1
+
+    with pytest.warns(UserWarning, match="Version unknown"):
+        header = parse_event_header(data.tobytes())
+
+    assert header.dtype == event_header_dtype_77xxx
+
+
+def test_make_event_header_parser():
+    from corsikaio.io import read_buffer_size, read_block
+    from corsikaio.subblocks import parse_event_header, make_event_header_parser
+
+    path = 'tests/resources/corsika74100'
+    buffer_size = read_buffer_size(path)
+    with open(path, 'rb') as f:
+        read_block(f, buffer_size)
+        block = read_block(f, buffer_size)
+
+    fields = ("event_number", "total_energy", "observation_height")
+    parse = make_event_header_parser(7.41, fields)
+    assert make_event_header_parser(7.41, fields) is parse
+
+    header = parse(block)[0]
+    expected = parse_event_header(block)[0]
+
+    assert header.dtype.names == fields
+    for field in fields:
+        assert np.all(header[field] == expected[field])
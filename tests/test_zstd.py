@@ -22,3 +22,47 @@ def test_is_zstd(tmp_path):
             writer.write(b'Hello World')
 
     assert is_zstd(path)
+
+
+def test_open_compressed_zstd():
+    pytest.importorskip("zstandard")
+
+    from corsikaio.io import open_compressed
+
+    with open_compressed('tests/resources/corsika75700.zst') as f:
+        data = f.read()
+
+    with open('tests/resources/corsika75700', 'rb') as f:
+        assert data == f.read()
+
+
+def test_zstd_file():
+    pytest.importorskip("zstandard")
+
+    from corsikaio import CorsikaFile
+
+    events = [e for e in CorsikaFile('tests/resources/corsika75700.zst')]
+
+    assert len(events) == 10
+
+
+def test_zstd_file_streaming():
+    pytest.importorskip("zstandard")
+
+    from corsikaio.io import open_compressed, iter_blocks
+
+    with open_compressed('tests/resources/corsika75700.zst', size_threshold=0) as f:
+        blocks = [bytes(block) for block in iter_blocks(f)]
+
+    with open('tests/resources/corsika75700', 'rb') as f:
+        expected = [bytes(block) for block in iter_blocks(f)]
+
+    assert blocks == expected
+
+
+def test_probe_zstd():
+    pytest.importorskip("zstandard")
+
+    from corsikaio.io import probe
+
+    assert probe('tests/resources/corsika75700.zst') == ('zstd', 22932)